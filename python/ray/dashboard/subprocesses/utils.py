@@ -1,5 +1,6 @@
-import os
 import enum
+import functools
+import os
 from typing import TypeVar
 from ray._private.utils import validate_socket_filepath
 
@@ -13,6 +14,7 @@ class ResponseType(enum.Enum):
     WEBSOCKET = "websocket"
 
 
+@functools.lru_cache(maxsize=None)
 def module_logging_filename(
     module_name: str, logging_filename: str, is_stderr=False
 ) -> str:
@@ -35,6 +37,7 @@ def module_logging_filename(
     return f"{stem}_{module_name}{extension}"
 
 
+@functools.lru_cache(maxsize=None)
 def get_socket_path(socket_dir: str, module_name: str) -> str:
     socket_path = os.path.join(socket_dir, "dash_" + module_name)
     validate_socket_filepath(socket_path)
@@ -382,10 +382,13 @@ class ArrowBlockColumnAccessor(BlockColumnAccessor):
         super().__init__(col)
 
     def count(self, *, ignore_nulls: bool, as_py: bool = True) -> Optional[U]:
-        import pyarrow.compute as pac
+        # NOTE: Count is derived from the length and the null count (that is
+        #       cached by Arrow), avoiding dispatching of the compute kernel
+        res = len(self._column)
+        if ignore_nulls:
+            res -= self._column.null_count
 
-        res = pac.count(self._column, mode="only_valid" if ignore_nulls else "all")
-        return res.as_py() if as_py else res
+        return res if as_py else pyarrow.scalar(res, type=pyarrow.int64())
 
     def sum(self, *, ignore_nulls: bool, as_py: bool = True) -> Optional[U]:
         import pyarrow.compute as pac
@@ -423,9 +426,9 @@ class ArrowBlockColumnAccessor(BlockColumnAccessor):
         if mean is None:
             return None
 
-        res = pac.sum(
-            pac.power(pac.subtract(self._column, mean), 2), skip_nulls=ignore_nulls
-        )
+        diff = pac.subtract(self._column, mean)
+        # NOTE: Squaring via multiplication avoids generic `power` kernel
+        res = pac.sum(pac.multiply(diff, diff), skip_nulls=ignore_nulls)
         return res.as_py() if as_py else res
 
     def quantile(
@@ -210,13 +210,14 @@ class TableBlockAccessor(BlockAccessor):
         class Iter:
             def __init__(self):
                 self._cur = -1
+                self._num_rows = outer.num_rows()
 
             def __iter__(self):
                 return self
 
             def __next__(self):
                 self._cur += 1
-                if self._cur < outer.num_rows():
+                if self._cur < self._num_rows:
                     row = outer._get_row(self._cur)
                     if public_row_format and isinstance(row, TableRow):
                         return row.as_pydict()
@@ -311,7 +312,9 @@ class TableBlockAccessor(BlockAccessor):
         self._validate_column(on)
 
         accessor = BlockColumnAccessor.for_column(self._table[on])
-        return accessor.sum_of_squared_diffs_from_mean(ignore_nulls=ignore_nulls)
+        return accessor.sum_of_squared_diffs_from_mean(
+            ignore_nulls=ignore_nulls, mean=mean
+        )
 
     def _validate_column(self, col: str):
         if col is None:
@@ -1515,10 +1515,10 @@ def _validate_rows_per_file_args(
 def is_nan(value) -> bool:
     """Returns true if provide value is ``np.nan``"""
 
-    try:
-        return isinstance(value, float) and np.isnan(value)
-    except TypeError:
-        return False
+    # NOTE: NaN is the only float not equal to itself, which allows to avoid
+    #       relatively expensive ``np.isnan`` call (this is on the hot path of
+    #       combining partial aggregations)
+    return isinstance(value, float) and value != value
 
 
 def is_null(value: Any) -> bool:
@@ -5,7 +5,16 @@ from typing import TYPE_CHECKING, Callable, List, Optional, Any
 import numpy as np
 
 from ray.data._internal.util import is_null
-from ray.data.block import AggType, Block, BlockAccessor, KeyType, T, U
+from ray.data.block import (
+    AggType,
+    Block,
+    BlockAccessor,
+    BlockColumn,
+    BlockColumnAccessor,
+    KeyType,
+    T,
+    U,
+)
 from ray.util.annotations import PublicAPI, Deprecated
 
 if TYPE_CHECKING:
@@ -62,6 +71,8 @@ class AggregateFn:
             # result: [{'group': 'A', 'custom_count': 2}, {'group': 'B', 'custom_count': 1}]
     """
 
+    __slots__ = ("name", "init", "merge", "accumulate_block", "finalize")
+
     def __init__(
         self,
         init: Callable[[KeyType], AggType],
@@ -121,6 +132,13 @@ class AggregateFnV2(AggregateFn, abc.ABC):
 
     """
 
+    __slots__ = ("_target_col_name", "_ignore_nulls")
+
+    # NOTE: Aggregations that never produce nulls from `aggregate_block` (for ex,
+    #       count) should set this to False, allowing to skip null-safe wrappers
+    #       (specialized once upon construction)
+    _null_safe: bool = True
+
     def __init__(
         self,
         name: str,
@@ -137,23 +155,58 @@ class AggregateFnV2(AggregateFn, abc.ABC):
         self._target_col_name = on
         self._ignore_nulls = ignore_nulls
 
-        _safe_combine = _null_safe_combine(self.combine, ignore_nulls)
-        _safe_aggregate = _null_safe_aggregate(self.aggregate_block, ignore_nulls)
-        _safe_finalize = _null_safe_finalize(self._finalize)
+        if self._null_safe:
+            _aggregate = _null_safe_aggregate(self.aggregate_block, ignore_nulls)
+        else:
+            _aggregate = self.aggregate_block
+
+        # NOTE: Empty accumulator is encoded as null only when ignore_nulls=True
+        #       (see `_null_safe_zero_factory`), hence aggregations not producing
+        #       nulls could skip null-safe combination/finalization otherwise
+        if self._null_safe or ignore_nulls:
+            _combine = _null_safe_combine(self.combine, ignore_nulls)
+            _finalize = _null_safe_finalize(self._finalize)
+        else:
+            _combine = self.combine
+            _finalize = self._finalize
 
         _safe_zero_factory = _null_safe_zero_factory(zero_factory, ignore_nulls)
 
         super().__init__(
             name=name,
             init=_safe_zero_factory,
-            merge=_safe_combine,
-            accumulate_block=lambda _, block: _safe_aggregate(block),
-            finalize=_safe_finalize,
+            merge=_combine,
+            accumulate_block=lambda _, block: _aggregate(block),
+            finalize=_finalize,
         )
 
     def get_target_column(self) -> Optional[str]:
         return self._target_col_name
 
+    def _get_target_column(self, block: Block) -> BlockColumn:
+        """Returns target column of the provided block.
+
+        NOTE: Target column is validated against the dataset's schema upfront
+              (see ``_validate``), hence it's only validated here (raising the
+              same errors as the ``BlockAccessor`` helpers) when it could not
+              be resolved
+        """
+        block_acc = BlockAccessor.for_block(block)
+
+        if not isinstance(self._target_col_name, str):
+            block_acc._validate_column(self._target_col_name)
+
+        try:
+            return block_acc.to_block()[self._target_col_name]
+        except KeyError:
+            block_acc._validate_column(self._target_col_name)
+            raise
+
+    def _get_target_column_accessor(self, block: Block) -> BlockColumnAccessor:
+        """Returns accessor of the target column of the provided block, allowing
+        to apply multiple operations to it w/o repeatedly resolving it."""
+        return BlockColumnAccessor.for_column(self._get_target_column(block))
+
     @abc.abstractmethod
     def combine(self, current_accumulator: AggType, new: AggType) -> AggType:
         """Combines new partially aggregated value (previously returned
@@ -183,6 +236,10 @@ class AggregateFnV2(AggregateFn, abc.ABC):
 class Count(AggregateFnV2):
     """Defines count aggregation."""
 
+    __slots__ = ()
+
+    _null_safe = False
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -197,14 +254,12 @@ class Count(AggregateFnV2):
         )
 
     def aggregate_block(self, block: Block) -> AggType:
-        block_accessor = BlockAccessor.for_block(block)
-
         if self._target_col_name is None:
             # In case of global count, simply fetch number of rows
-            return block_accessor.num_rows()
+            return BlockAccessor.for_block(block).num_rows()
 
-        return block_accessor.count(
-            self._target_col_name, ignore_nulls=self._ignore_nulls
+        return self._get_target_column_accessor(block).count(
+            ignore_nulls=self._ignore_nulls
         )
 
     def combine(self, current_accumulator: AggType, new: AggType) -> AggType:
@@ -215,6 +270,8 @@ class Count(AggregateFnV2):
 class Sum(AggregateFnV2):
     """Defines sum aggregation."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -229,8 +286,8 @@ class Sum(AggregateFnV2):
         )
 
     def aggregate_block(self, block: Block) -> AggType:
-        return BlockAccessor.for_block(block).sum(
-            self._target_col_name, self._ignore_nulls
+        return self._get_target_column_accessor(block).sum(
+            ignore_nulls=self._ignore_nulls
         )
 
     def combine(self, current_accumulator: AggType, new: AggType) -> AggType:
@@ -241,6 +298,8 @@ class Sum(AggregateFnV2):
 class Min(AggregateFnV2):
     """Defines min aggregation."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -255,18 +314,21 @@ class Min(AggregateFnV2):
         )
 
     def aggregate_block(self, block: Block) -> AggType:
-        return BlockAccessor.for_block(block).min(
-            self._target_col_name, self._ignore_nulls
+        return self._get_target_column_accessor(block).min(
+            ignore_nulls=self._ignore_nulls
         )
 
     def combine(self, current_accumulator: AggType, new: AggType) -> AggType:
-        return min(current_accumulator, new)
+        # NOTE: This is equivalent to (but avoids overhead of calling) ``min``
+        return new if new < current_accumulator else current_accumulator
 
 
 @PublicAPI
 class Max(AggregateFnV2):
     """Defines max aggregation."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -282,18 +344,21 @@ class Max(AggregateFnV2):
         )
 
     def aggregate_block(self, block: Block) -> AggType:
-        return BlockAccessor.for_block(block).max(
-            self._target_col_name, self._ignore_nulls
+        return self._get_target_column_accessor(block).max(
+            ignore_nulls=self._ignore_nulls
         )
 
     def combine(self, current_accumulator: AggType, new: AggType) -> AggType:
-        return max(current_accumulator, new)
+        # NOTE: This is equivalent to (but avoids overhead of calling) ``max``
+        return new if new > current_accumulator else current_accumulator
 
 
 @PublicAPI
 class Mean(AggregateFnV2):
     """Defines mean aggregation."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -310,14 +375,14 @@ class Mean(AggregateFnV2):
         )
 
     def aggregate_block(self, block: Block) -> AggType:
-        block_acc = BlockAccessor.for_block(block)
-        count = block_acc.count(self._target_col_name, self._ignore_nulls)
+        col_acc = self._get_target_column_accessor(block)
+        count = col_acc.count(ignore_nulls=self._ignore_nulls)
 
         if count == 0 or count is None:
             # Empty or all null.
             return None
 
-        sum_ = block_acc.sum(self._target_col_name, self._ignore_nulls)
+        sum_ = col_acc.sum(ignore_nulls=self._ignore_nulls)
 
         if is_null(sum_):
             # In case of ignore_nulls=False and column containing 'null'
@@ -350,6 +415,8 @@ class Std(AggregateFnV2):
     https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Welford's_online_algorithm
     """
 
+    __slots__ = ("_ddof",)
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -369,20 +436,20 @@ class Std(AggregateFnV2):
         self._ddof = ddof
 
     def aggregate_block(self, block: Block) -> AggType:
-        block_acc = BlockAccessor.for_block(block)
-        count = block_acc.count(self._target_col_name, ignore_nulls=self._ignore_nulls)
+        col_acc = self._get_target_column_accessor(block)
+        count = col_acc.count(ignore_nulls=self._ignore_nulls)
         if count == 0 or count is None:
             # Empty or all null.
             return None
-        sum_ = block_acc.sum(self._target_col_name, self._ignore_nulls)
+        sum_ = col_acc.sum(ignore_nulls=self._ignore_nulls)
         if is_null(sum_):
             # In case of ignore_nulls=False and column containing 'null'
             # return as is (to prevent unnecessary type conversions, when, for ex,
             # using Pandas and returning None)
             return sum_
         mean = sum_ / count
-        M2 = block_acc.sum_of_squared_diffs_from_mean(
-            self._target_col_name, self._ignore_nulls, mean
+        M2 = col_acc.sum_of_squared_diffs_from_mean(
+            ignore_nulls=self._ignore_nulls, mean=mean
         )
         return [M2, mean, count]
 
@@ -416,6 +483,8 @@ class Std(AggregateFnV2):
 class AbsMax(AggregateFnV2):
     """Defines absolute max aggregation."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -433,13 +502,33 @@ class AbsMax(AggregateFnV2):
         )
 
     def combine(self, current_accumulator: AggType, new: AggType) -> AggType:
-        return max(current_accumulator, new)
+        return new if new > current_accumulator else current_accumulator
 
     def aggregate_block(self, block: Block) -> AggType:
-        block_accessor = BlockAccessor.for_block(block)
+        import pyarrow as pa
+        import pyarrow.compute as pac
 
-        max_ = block_accessor.max(self._target_col_name, self._ignore_nulls)
-        min_ = block_accessor.min(self._target_col_name, self._ignore_nulls)
+        col = self._get_target_column(block)
+
+        # NOTE: For floating point (and unsigned) columns absolute max is
+        #       computed in a single pass over the column (instead of computing
+        #       both max and min of it). Signed integer columns are excluded,
+        #       since abs of their min value overflows
+        if isinstance(col, (pa.Array, pa.ChunkedArray)):
+            # NOTE: Arrow's abs kernel doesn't support float16
+            if pa.types.is_unsigned_integer(col.type) or (
+                pa.types.is_floating(col.type) and not pa.types.is_float16(col.type)
+            ):
+                res = pac.max(pac.abs(col), skip_nulls=self._ignore_nulls).as_py()
+                return None if is_null(res) else res
+        elif col.dtype.kind in ("f", "u"):
+            res = col.abs().max(skipna=self._ignore_nulls)
+            return None if is_null(res) else res
+
+        col_acc = BlockColumnAccessor.for_column(col)
+
+        max_ = col_acc.max(ignore_nulls=self._ignore_nulls)
+        min_ = col_acc.min(ignore_nulls=self._ignore_nulls)
 
         if is_null(max_) or is_null(min_):
             return None
@@ -452,7 +541,15 @@ class AbsMax(AggregateFnV2):
 
 @PublicAPI
 class Quantile(AggregateFnV2):
-    """Defines Quantile aggregation."""
+    """Defines Quantile aggregation.
+
+    By default all of the values are accumulated to compute the exact quantile.
+    Alternatively, with ``use_sketch=True`` values are accumulated into the
+    (bounded in size) t-digest sketch, yielding an approximate quantile of the
+    numeric column instead. See https://arxiv.org/abs/1902.04023
+    """
+
+    __slots__ = ("_q", "_use_sketch")
 
     def __init__(
         self,
@@ -460,17 +557,22 @@ class Quantile(AggregateFnV2):
         q: float = 0.5,
         ignore_nulls: bool = True,
         alias_name: Optional[str] = None,
+        use_sketch: bool = False,
     ):
         self._q = q
+        self._use_sketch = use_sketch
 
         super().__init__(
             alias_name if alias_name else f"quantile({str(on)})",
             on=on,
             ignore_nulls=ignore_nulls,
-            zero_factory=list,
+            zero_factory=_empty_quantile_sketch if use_sketch else list,
         )
 
     def combine(self, current_accumulator: List[Any], new: List[Any]) -> List[Any]:
+        if self._use_sketch:
+            return _merge_quantile_sketches(current_accumulator, new)
+
         if isinstance(current_accumulator, List) and isinstance(new, List):
             current_accumulator.extend(new)
             return current_accumulator
@@ -496,15 +598,93 @@ class Quantile(AggregateFnV2):
         return ls
 
     def aggregate_block(self, block: Block) -> AggType:
-        block_acc = BlockAccessor.for_block(block)
-        ls = []
+        if self._use_sketch:
+            values = np.asarray(self._get_target_column(block), dtype=np.float64)
+            nulls = np.isnan(values)
+            if nulls.any():
+                if not self._ignore_nulls:
+                    return None
+                values = values[~nulls]
+
+            if len(values) == 0 and self._ignore_nulls:
+                # NOTE: Empty sketch is encoded as null (same as by the
+                #       null-safe zero factory), since its empty lists can't be
+                #       typed when persisted in the partially aggregated blocks
+                return None
+
+            return _compress_quantile_sketch(values, np.ones_like(values))
+
+        # NOTE: Column is extracted as a whole (instead of iterating over the
+        #       rows) to avoid materializing individual rows. Accumulator is
+        #       kept as a Python list, since it has to be persisted in the
+        #       partially aggregated blocks
+        return self._get_target_column_accessor(block).to_pylist()
 
-        for row in block_acc.iter_rows(public_row_format=False):
-            ls.append(row.get(self._target_col_name))
+    def _finalize(self, accumulator: List[Any]) -> Optional[U]:
+        if self._use_sketch:
+            return _quantile_from_sketch(accumulator, self._q)
 
-        return ls
+        import pyarrow as pa
+        import pyarrow.compute as pac
 
-    def _finalize(self, accumulator: List[Any]) -> Optional[U]:
+        # NOTE: Converting to Arrow (with NaNs being treated as nulls) allows
+        #       to determine presence of nulls and drop them w/o traversing
+        #       the accumulator in Python
+        try:
+            values = pa.array(accumulator, from_pandas=True)
+        except (pa.ArrowException, OverflowError):
+            # NOTE: Values that can't be converted to Arrow (for ex, ints
+            #       overflowing int64 or values of mixed types) are handled
+            #       by the generic (sort-based) path
+            return self._quantile_of_list(accumulator)
+
+        valid_indices = None
+        if values.null_count > 0:
+            if not self._ignore_nulls:
+                # NOTE: We return the null itself to preserve column type.
+                #       Arrow also treats nulls not recognized by ``is_null``
+                #       (for ex, ``pd.NA``) as such, these are returned as None
+                return next((v for v in accumulator if is_null(v)), None)
+
+            valid_indices = np.flatnonzero(
+                pac.is_valid(values).to_numpy(zero_copy_only=False)
+            )
+            values = pac.drop_null(values)
+
+        if len(values) == 0:
+            return None
+
+        if pa.types.is_integer(values.type) or pa.types.is_floating(values.type):
+            k = (len(values) - 1) * self._q
+            f = math.floor(k)
+            c = math.ceil(k)
+
+            # NOTE: For numeric values only the (at most 2) values adjacent to
+            #       the quantile are determined, by partitioning (rather than
+            #       fully sorting) the values. Partitioning yields indices of
+            #       these values, so that the original elements (rather than
+            #       the ones converted to the common Arrow type, for ex, ints
+            #       promoted to doubles) are used
+            indices = np.argpartition(values.to_numpy(), [f, c])
+            if valid_indices is not None:
+                indices = valid_indices[indices]
+
+            if f == c:
+                return accumulator[indices[f]]
+
+            d0 = accumulator[indices[f]] * (c - k)
+            d1 = accumulator[indices[c]] * (k - f)
+
+            return round(d0 + d1, 5)
+
+        # NOTE: Original elements (rather than the ones converted to Arrow,
+        #       for ex, ``pd.Timestamp`` truncated to ``datetime``) are sorted
+        if valid_indices is not None:
+            accumulator = [accumulator[i] for i in valid_indices]
+
+        return self._quantile_of_list(accumulator)
+
+    def _quantile_of_list(self, accumulator: List[Any]) -> Optional[U]:
         if self._ignore_nulls:
             accumulator = [v for v in accumulator if not is_null(v)]
         else:
@@ -536,6 +716,8 @@ class Quantile(AggregateFnV2):
 class Unique(AggregateFnV2):
     """Defines unique aggregation."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -550,6 +732,9 @@ class Unique(AggregateFnV2):
         )
 
     def combine(self, current_accumulator: AggType, new: AggType) -> AggType:
+        # NOTE: Partial results are small Python collections (persisted in the
+        #       partially aggregated blocks), for which set union is cheaper
+        #       than round-tripping them through Arrow
         return self._to_set(current_accumulator) | self._to_set(new)
 
     def aggregate_block(self, block: Block) -> AggType:
@@ -568,6 +753,73 @@ class Unique(AggregateFnV2):
             return {x}
 
 
+# Compression parameter of the quantile sketch (t-digest), bounding the number
+# of centroids it's retaining (to roughly half of it)
+_QUANTILE_SKETCH_COMPRESSION = 1000
+
+
+def _empty_quantile_sketch() -> List[List[float]]:
+    return [[], []]
+
+
+def _compress_quantile_sketch(
+    means: np.ndarray, weights: np.ndarray
+) -> List[List[float]]:
+    """Compresses provided centroids (weighted values) into a t-digest sketch,
+    represented as a pair of lists of centroids' means and weights (to allow
+    it to be persisted in a block).
+
+    Centroids are merged when they fall into the same unit interval of the
+    t-digest's k1 scale function, keeping centroids at the tails small (hence
+    preserving accuracy of the extreme quantiles)
+    """
+    if len(means) == 0:
+        return _empty_quantile_sketch()
+
+    order = np.argsort(means, kind="stable")
+    means, weights = means[order], weights[order]
+
+    # Normalized cumulative weight at the center of every centroid
+    q = (np.cumsum(weights) - weights / 2) / weights.sum()
+    k = np.floor(_QUANTILE_SKETCH_COMPRESSION / (2 * np.pi) * np.arcsin(2 * q - 1))
+
+    is_start = np.concatenate([[True], k[1:] != k[:-1]])
+    # NOTE: Extreme values are always kept as standalone centroids to make sure
+    #       min and max are preserved exactly
+    is_start[1:2] = True
+    is_start[-1] = True
+
+    starts = np.flatnonzero(is_start)
+
+    merged_weights = np.add.reduceat(weights, starts)
+    merged_means = np.add.reduceat(means * weights, starts) / merged_weights
+
+    return [merged_means.tolist(), merged_weights.tolist()]
+
+
+def _merge_quantile_sketches(
+    sketch_a: List[List[float]], sketch_b: List[List[float]]
+) -> List[List[float]]:
+    means = np.concatenate([sketch_a[0], sketch_b[0]]).astype(np.float64)
+    weights = np.concatenate([sketch_a[1], sketch_b[1]]).astype(np.float64)
+
+    return _compress_quantile_sketch(means, weights)
+
+
+def _quantile_from_sketch(sketch: List[List[float]], q: float) -> Optional[float]:
+    means = np.asarray(sketch[0], dtype=np.float64)
+    weights = np.asarray(sketch[1], dtype=np.float64)
+
+    if len(means) == 0:
+        return None
+
+    # NOTE: Centroid's mean is assumed to be located at the center of its
+    #       cumulative weight, which makes this identical to the exact (linear)
+    #       quantile while none of the values have been merged yet
+    centers = np.cumsum(weights) - weights / 2
+    return float(np.interp(q * (weights.sum() - 1) + 0.5, centers, means))
+
+
 def _null_safe_zero_factory(zero_factory, ignore_nulls: bool):
     """NOTE: PLEASE READ CAREFULLY BEFORE CHANGING
 
@@ -662,15 +914,18 @@ def _null_safe_combine(
             - Otherwise combine (current and new)
     """
 
+    # NOTE: Null checks below are inlined equivalents of ``is_null``, since
+    #       combination is invoked for every pair of partial aggregations
+
     if ignore_nulls:
 
         def _safe_combine(
             cur: Optional[AggType], new: Optional[AggType]
         ) -> Optional[AggType]:
 
-            if is_null(cur):
+            if cur is None or (isinstance(cur, float) and cur != cur):
                 return new
-            elif is_null(new):
+            elif new is None or (isinstance(new, float) and new != new):
                 return cur
             else:
                 return combine(cur, new)
@@ -681,9 +936,9 @@ def _null_safe_combine(
             cur: Optional[AggType], new: Optional[AggType]
         ) -> Optional[AggType]:
 
-            if is_null(new):
+            if new is None or (isinstance(new, float) and new != new):
                 return new
-            elif is_null(cur):
+            elif cur is None or (isinstance(cur, float) and cur != cur):
                 return cur
             else:
                 return combine(cur, new)
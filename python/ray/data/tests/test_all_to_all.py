@@ -16,7 +16,7 @@ from ray.data._internal.arrow_ops.transform_pyarrow import (
     MIN_PYARROW_VERSION_TYPE_PROMOTION,
 )
 from ray.data._internal.planner.exchange.sort_task_spec import SortKey
-from ray.data._internal.util import is_nan
+from ray.data._internal.util import is_nan, is_null
 from ray.data._internal.execution.interfaces.ref_bundle import (
     _ref_bundles_iterator_to_block_refs_list,
 )
@@ -1499,6 +1499,12 @@ def test_groupby_aggregations_are_associative(
         Mean("B", alias_name="mean_b", ignore_nulls=ignore_nulls),
         Std("B", alias_name="std_b", ignore_nulls=ignore_nulls),
         Quantile("B", alias_name="quantile_b", ignore_nulls=ignore_nulls),
+        Quantile(
+            "B",
+            alias_name="quantile_sketch_b",
+            ignore_nulls=ignore_nulls,
+            use_sketch=True,
+        ),
         Unique("B", alias_name="unique_b"),
     ]
 
@@ -1517,6 +1523,10 @@ def test_groupby_aggregations_are_associative(
                     "quantile_b",
                     lambda s: s.quantile() if ignore_nulls or not s.hasnans else np.nan,
                 ),
+                (
+                    "quantile_sketch_b",
+                    lambda s: s.quantile() if ignore_nulls or not s.hasnans else np.nan,
+                ),
                 ("unique_b", "unique"),
             ]
         },
@@ -1532,6 +1542,7 @@ def test_groupby_aggregations_are_associative(
         "mean_b",
         "std_b",
         "quantile_b",
+        "quantile_sketch_b",
         "unique_b",
     ]
 
@@ -1591,6 +1602,88 @@ def test_groupby_aggregations_are_associative(
         pd.testing.assert_frame_equal(expected_df, res, check_dtype=False)
 
 
+@pytest.mark.parametrize("ds_format", ["pyarrow", "pandas"])
+@pytest.mark.parametrize("q", [0.0, 0.01, 0.5, 0.99, 1.0])
+def test_quantile_sketch(ds_format, q):
+    rng = np.random.default_rng(1738379113)
+    xs = rng.lognormal(size=100_000)
+
+    agg = Quantile("A", q=q, use_sketch=True)
+
+    acc = agg.init(None)
+    for chunk in np.array_split(xs, 100):
+        if ds_format == "pyarrow":
+            block = pa.table({"A": chunk})
+        else:
+            block = pd.DataFrame({"A": chunk})
+
+        acc = agg.merge(acc, agg.accumulate_block(agg.init(None), block))
+
+    # NOTE: Sketch is bounded in size
+    assert len(acc[0]) <= 1000
+
+    expected = np.quantile(xs, q)
+    assert agg.finalize(acc) == pytest.approx(expected, rel=1e-2)
+
+
+def test_quantile_sketch_exact_for_small_inputs():
+    xs = [5, 1, 4, 2, 3, 8]
+
+    exact = Quantile("A", q=0.3)
+    sketch = Quantile("A", q=0.3, use_sketch=True)
+
+    block = pd.DataFrame({"A": xs})
+
+    assert sketch.finalize(
+        sketch.accumulate_block(sketch.init(None), block)
+    ) == exact.finalize(exact.accumulate_block(exact.init(None), block))
+
+
+@pytest.mark.parametrize("ds_format", ["pyarrow", "pandas"])
+@pytest.mark.parametrize("ignore_nulls", [True, False])
+def test_std_aggregate_block(ds_format, ignore_nulls):
+    xs = [1, 2, None, 6]
+
+    if ds_format == "pyarrow":
+        block = pa.table({"A": xs})
+    else:
+        block = pd.DataFrame({"A": xs})
+
+    agg = Std("A", ignore_nulls=ignore_nulls)
+    result = agg.aggregate_block(block)
+
+    if ignore_nulls:
+        # NOTE: Accumulator is [M2, mean, count]
+        assert result == [14.0, 3.0, 3]
+    else:
+        # NOTE: Null is returned as is, i.e. None for Arrow and NaN for Pandas
+        assert is_null(result)
+
+
+@pytest.mark.parametrize("ds_format", ["pyarrow", "pandas"])
+@pytest.mark.parametrize("ignore_nulls", [True, False])
+def test_quantile_timestamps(ds_format, ignore_nulls):
+    xs = [
+        pd.Timestamp("2020-01-01 00:00:00.000000001"),
+        None,
+        pd.Timestamp("2021-01-01"),
+    ]
+
+    if ds_format == "pyarrow":
+        block = pa.table({"A": pa.array(xs, type=pa.timestamp("ns"))})
+    else:
+        block = pd.DataFrame({"A": xs})
+
+    agg = Quantile("A", q=0.0, ignore_nulls=ignore_nulls)
+    result = agg.finalize(agg.accumulate_block(agg.init(None), block))
+
+    if ignore_nulls:
+        assert result == pd.Timestamp("2020-01-01 00:00:00.000000001")
+        assert isinstance(result, pd.Timestamp)
+    else:
+        assert pd.isnull(result)
+
+
 @pytest.mark.parametrize("num_parts", [1, 2, 30])
 def test_groupby_map_groups_for_none_groupkey(
     ray_start_regular_shared_2_cpus,
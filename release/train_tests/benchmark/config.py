@@ -1,26 +1,45 @@
-import argparse
-import enum
-
-from pydantic import BaseModel, Field
-
-
-class DataloaderType(enum.Enum):
-    RAY_DATA = "ray_data"
-    MOCK = "mock"
-    TORCH = "torch"
-
-
-class DataLoaderConfig(BaseModel):
+import dataclasses
+import functools
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    get_args,
+    get_origin,
+)
+
+if TYPE_CHECKING:
+    import argparse
+
+
+DataloaderType = Literal["ray_data", "mock", "torch"]
+
+
+@dataclasses.dataclass(frozen=True)
+class DataLoaderConfig:
     train_batch_size: int = 32
     validation_batch_size: int = 256
     prefetch_batches: int = 1
 
 
+# Shared by all `BenchmarkConfig`s that don't set a dataloader config.
+# Configs are frozen, so it must never be mutated (e.g. via `object.__setattr__`).
+_DEFAULT_DATALOADER_CONFIG = DataLoaderConfig()
+
+
+@dataclasses.dataclass(frozen=True)
 class RayDataConfig(DataLoaderConfig):
     # NOTE: Optional[int] doesn't play well with argparse.
     local_buffer_shuffle_size: int = -1
 
 
+@dataclasses.dataclass(frozen=True)
 class TorchConfig(DataLoaderConfig):
     num_torch_workers: int = 8
     torch_dataloader_timeout_seconds: int = 300
@@ -28,7 +47,16 @@ class TorchConfig(DataLoaderConfig):
     torch_non_blocking: bool = True
 
 
-class BenchmarkConfig(BaseModel):
+# Dataloader config class to use for each `dataloader_type`.
+_DATALOADER_CONFIG_CLS: Dict[DataloaderType, Type[DataLoaderConfig]] = {
+    "ray_data": RayDataConfig,
+    "torch": TorchConfig,
+    "mock": DataLoaderConfig,
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class BenchmarkConfig:
     # ScalingConfig
     num_workers: int = 1
 
@@ -41,10 +69,8 @@ class BenchmarkConfig(BaseModel):
     task: str = "image_classification"
 
     # Data
-    dataloader_type: DataloaderType = DataloaderType.RAY_DATA
-    dataloader_config: DataLoaderConfig = Field(
-        default_factory=lambda: DataLoaderConfig(),
-    )
+    dataloader_type: DataloaderType = "ray_data"
+    dataloader_config: DataLoaderConfig = _DEFAULT_DATALOADER_CONFIG
 
     # Training
     num_epochs: int = 1
@@ -62,53 +88,237 @@ class BenchmarkConfig(BaseModel):
     log_metrics_every_n_steps: int = 512
 
 
-def _is_pydantic_model(field_type) -> bool:
-    """Check if a type is a subclass of Pydantic's BaseModel."""
-    return isinstance(field_type, type) and issubclass(field_type, BaseModel)
+# Config classes that can be nested in another config.
+_NESTED_CONFIG_CLASSES = frozenset({DataLoaderConfig, RayDataConfig, TorchConfig})
 
 
-def _add_field_to_parser(parser: argparse.ArgumentParser, field: str, field_info):
-    field_type = field_info.annotation
-    if field_type is bool:
-        parser.add_argument(
-            f"--{field}",
-            action="store_true",
-            help=f"Enable {field} (default: {field_info.default})",
-        )
-    else:
-        parser.add_argument(f"--{field}", type=field_type, default=field_info.default)
+def _is_config_class(field_type) -> bool:
+    """Check if a type is a (nested) config class."""
+    return field_type in _NESTED_CONFIG_CLASSES
 
 
-def cli_to_config() -> BenchmarkConfig:
-    parser = argparse.ArgumentParser()
+def _fields_of(config_cls):
+    """Returns `(name, field_info)` pairs for all fields of the config class."""
+    return tuple((f.name, f) for f in dataclasses.fields(config_cls))
+
+
+def _literal_converter(field_type) -> Callable[[str], str]:
+    # Values are interned, so they share the same string objects as the
+    # `Literal` choices (e.g. the `_DATALOADER_CONFIG_CLS` keys).
+    choices = frozenset(get_args(field_type))
+
+    def convert(value: str) -> str:
+        if value not in choices:
+            raise ValueError(f"invalid choice: {value!r}")
+        return sys.intern(value)
+
+    return convert
+
+
+# Converter factory for field types that can't convert a CLI string to a
+# value by themselves, keyed by the type's origin for parametrized types.
+_CONVERTER_FACTORIES = {
+    Literal: _literal_converter,
+}
+
+
+def _field_converter(field_type) -> Callable[[str], Any]:
+    """Returns the function converting a CLI string to a value of the field type.
+
+    Boolean fields are flags that don't take a value, so have no converter.
+    """
+    factory = _CONVERTER_FACTORIES.get(get_origin(field_type) or field_type)
+    if factory is None:
+        return field_type
+    return factory(field_type)
+
+
+def _add_bool_field(
+    parser: "argparse.ArgumentParser", field: str, field_info: dataclasses.Field
+):
+    parser.add_argument(
+        f"--{field}",
+        action="store_true",
+        help=f"Enable {field} (default: {field_info.default})",
+    )
+
+
+def _add_typed_field(
+    parser: "argparse.ArgumentParser", field: str, field_info: dataclasses.Field
+):
+    parser.add_argument(
+        f"--{field}",
+        type=_field_converter(field_info.type),
+        default=field_info.default,
+    )
 
-    nested_fields = []
-    for field, field_info in BenchmarkConfig.model_fields.items():
-        # Skip nested configs for now
-        if _is_pydantic_model(field_info.annotation):
-            nested_fields.append(field)
-            continue
 
+# Parser handler for each field type, keyed by the type's origin for
+# parametrized types. Other types use `_add_typed_field`.
+_FIELD_HANDLERS = {
+    bool: _add_bool_field,
+}
+
+
+def _add_field_to_parser(
+    parser: "argparse.ArgumentParser", field: str, field_info: dataclasses.Field
+):
+    field_type = field_info.type
+    handler = _FIELD_HANDLERS.get(
+        get_origin(field_type) or field_type, _add_typed_field
+    )
+    handler(parser, field, field_info)
+
+
+def _split_fields(config_cls):
+    """Splits the fields of the config class into plain and nested config fields.
+
+    Returns a tuple of `(name, field_info)` pairs for plain fields and a tuple
+    of `(name, nested_config_cls)` pairs for nested config fields.
+    """
+    plain_fields, nested_fields = [], []
+    for field, field_info in _fields_of(config_cls):
+        if _is_config_class(field_info.type):
+            nested_fields.append((field, field_info.type))
+        else:
+            plain_fields.append((field, field_info))
+    return tuple(plain_fields), tuple(nested_fields)
+
+
+_, _NESTED_FIELDS = _split_fields(BenchmarkConfig)
+
+
+# All config classes whose fields can be set from the command line.
+_CONFIG_CLASSES = (BenchmarkConfig, DataLoaderConfig, RayDataConfig, TorchConfig)
+
+# Names of the plain (non-nested) fields of each config class.
+_FIELDS_PER_CLASS = {
+    config_cls: tuple(field for field, _ in _split_fields(config_cls)[0])
+    for config_cls in _CONFIG_CLASSES
+}
+
+
+def _cli_fields():
+    """Returns `(name, field_info)` pairs for the plain fields of all config classes.
+
+    Fields shared by several config classes (e.g. the `DataLoaderConfig`
+    fields) are only returned once, since they share the same defaults.
+    """
+    cli_fields = {}
+    for config_cls in _CONFIG_CLASSES:
+        plain_fields, _ = _split_fields(config_cls)
+        for field, field_info in plain_fields:
+            cli_fields.setdefault(field, field_info)
+    return tuple(cli_fields.items())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_parser() -> "argparse.ArgumentParser":
+    """Builds (once) a single parser for the fields of all config classes.
+
+    `argparse` is imported here so that importing the config classes alone
+    doesn't pay for it.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    for field, field_info in _cli_fields():
         _add_field_to_parser(parser, field, field_info)
+    return parser
+
+
+@functools.lru_cache(maxsize=None)
+def _get_scanner_spec() -> Tuple[Dict[str, Tuple[str, Any]], Dict[str, Any]]:
+    """Builds (once) the option table and default values used by `_scan_args`.
+
+    The option table maps `--<field>` to `(field, converter)`, where the
+    converter is `None` for boolean flags. Defaults mirror the ones of the
+    argparse parser, i.e. boolean flags default to `False`.
+    """
+    options, defaults = {}, {}
+    for field, field_info in _cli_fields():
+        if field_info.type is bool:
+            converter, default = None, False
+        else:
+            converter = _field_converter(field_info.type)
+            default = field_info.default
+        options[f"--{field}"] = (field, converter)
+        defaults[field] = default
+    return options, defaults
+
+
+def _scan_args(args: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    """Parses CLI args into a dict of field values without argparse.
+
+    Only the `--<field>=<value>`, `--<field> <value>` and `--<flag>` forms
+    are supported. Returns `None` if the args contain anything else (e.g.
+    `--help`, unknown or abbreviated options, or invalid values), in which
+    case the caller should fall back to argparse, which handles (and
+    reports) those cases.
+    """
+    options, defaults = _get_scanner_spec()
+    values = dict(defaults)
+
+    i, num_args = 0, len(args)
+    while i < num_args:
+        option, has_value, value = args[i].partition("=")
+        spec = options.get(option)
+        if spec is None:
+            return None
+        field, converter = spec
+
+        if converter is None:
+            if has_value:
+                return None
+            values[field] = True
+            i += 1
+            continue
+
+        if not has_value:
+            i += 1
+            # Let argparse deal with missing values and values that look like
+            # options (or negative numbers).
+            if i == num_args or args[i].startswith("-"):
+                return None
+            value = args[i]
 
-    top_level_args, _ = parser.parse_known_args()
+        try:
+            values[field] = converter(value)
+        except ValueError:
+            return None
+        i += 1
+
+    return values
+
+
+@functools.lru_cache(maxsize=None)
+def _config_from_args(args: Tuple[str, ...]) -> BenchmarkConfig:
+    values = _scan_args(args)
+    if values is None:
+        parsed_args, _ = _get_parser().parse_known_args(args)
+        values = parsed_args.__dict__
+
+    config_values = {
+        field: values[field] for field in _FIELDS_PER_CLASS[BenchmarkConfig]
+    }
 
     # Handle nested configs that depend on top-level args
-    nested_configs = {}
-    for nested_field in nested_fields:
-        nested_parser = argparse.ArgumentParser()
-        config_cls = BenchmarkConfig.model_fields[nested_field].annotation
+    for nested_field, config_cls in _NESTED_FIELDS:
+        if config_cls is DataLoaderConfig:
+            config_cls = _DATALOADER_CONFIG_CLS[values["dataloader_type"]]
 
-        if config_cls == DataLoaderConfig:
-            if top_level_args.dataloader_type == DataloaderType.RAY_DATA:
-                config_cls = RayDataConfig
-            elif top_level_args.dataloader_type == DataloaderType.TORCH:
-                config_cls = TorchConfig
+        config_values[nested_field] = config_cls(
+            **{field: values[field] for field in _FIELDS_PER_CLASS[config_cls]}
+        )
+
+    return BenchmarkConfig(**config_values)
 
-        for field, field_info in config_cls.model_fields.items():
-            _add_field_to_parser(nested_parser, field, field_info)
 
-        args, _ = nested_parser.parse_known_args()
-        nested_configs[nested_field] = config_cls(**vars(args))
+def cli_to_config() -> BenchmarkConfig:
+    """Parses the benchmark config from the command line.
 
-    return BenchmarkConfig(**vars(top_level_args), **nested_configs)
+    CLI arguments don't change within a process, so the parsed config is
+    memoized per argument tuple. Configs are frozen, so the same instance can
+    be handed out to every caller.
+    """
+    return _config_from_args(tuple(sys.argv[1:]))
@@ -13,7 +13,7 @@ import ray.train
 from ray.data.datasource.partitioning import Partitioning
 
 # Local imports
-from config import DataloaderType, BenchmarkConfig
+from config import BenchmarkConfig
 from factory import BenchmarkFactory
 from dataloader_factory import BaseDataLoaderFactory
 from image_classification.factory import (
@@ -180,9 +180,9 @@ class ImageClassificationJpegTorchDataLoaderFactory(
 class ImageClassificationJpegFactory(BenchmarkFactory):
     def get_dataloader_factory(self) -> BaseDataLoaderFactory:
         data_factory_cls = {
-            DataloaderType.MOCK: ImageClassificationMockDataLoaderFactory,
-            DataloaderType.RAY_DATA: ImageClassificationJpegRayDataLoaderFactory,
-            DataloaderType.TORCH: ImageClassificationJpegTorchDataLoaderFactory,
+            "mock": ImageClassificationMockDataLoaderFactory,
+            "ray_data": ImageClassificationJpegRayDataLoaderFactory,
+            "torch": ImageClassificationJpegTorchDataLoaderFactory,
         }[self.benchmark_config.dataloader_type]
 
         return data_factory_cls(self.benchmark_config)
@@ -11,7 +11,7 @@ import ray.data
 import ray.train
 
 # Local imports
-from config import DataloaderType, BenchmarkConfig
+from config import BenchmarkConfig
 from factory import BenchmarkFactory
 from dataloader_factory import BaseDataLoaderFactory
 from image_classification.factory import (
@@ -146,9 +146,9 @@ class ImageClassificationParquetFactory(BenchmarkFactory):
             Factory instance for the configured dataloader type
         """
         data_factory_cls: Type[BaseDataLoaderFactory] = {
-            DataloaderType.MOCK: ImageClassificationMockDataLoaderFactory,
-            DataloaderType.RAY_DATA: ImageClassificationParquetRayDataLoaderFactory,
-            DataloaderType.TORCH: ImageClassificationParquetTorchDataLoaderFactory,
+            "mock": ImageClassificationMockDataLoaderFactory,
+            "ray_data": ImageClassificationParquetRayDataLoaderFactory,
+            "torch": ImageClassificationParquetTorchDataLoaderFactory,
         }[self.benchmark_config.dataloader_type]
 
         return data_factory_cls(self.benchmark_config)
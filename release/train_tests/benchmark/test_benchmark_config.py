@@ -0,0 +1,92 @@
+import sys
+
+import pytest
+
+import config
+from config import RayDataConfig, TorchConfig, cli_to_config
+
+
+def _parse_with_argparse(args):
+    parsed_args, _ = config._get_parser().parse_known_args(list(args))
+    return vars(parsed_args)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        (),
+        ("--num_workers=16",),
+        ("--num_workers", "16"),
+        ("--mock_gpu",),
+        ("--task=image_classification_jpeg", "--dataloader_type", "torch"),
+        ("--prefetch_batches", "32", "--num_torch_workers=16", "--skip_train_step"),
+        ("--validate_every_n_steps=-1",),
+        ("--local_buffer_shuffle_size=7", "--local_buffer_shuffle_size=8"),
+        ("--task=",),
+        ("--task=--mock_gpu",),
+    ],
+)
+def test_scan_args_matches_argparse(args):
+    values = config._scan_args(args)
+
+    assert values is not None
+    assert values == _parse_with_argparse(args)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        # Help is handled by argparse
+        ("--help",),
+        ("-h",),
+        # Unknown and abbreviated options
+        ("--unknown=3",),
+        ("--num_w=3",),
+        ("positional",),
+        ("--",),
+        # Negative (or option-like) values passed as separate args
+        ("--validate_every_n_steps", "-1"),
+        ("--task", "--mock_gpu"),
+        # Missing and invalid values
+        ("--num_workers",),
+        ("--num_workers=abc",),
+        ("--num_workers=",),
+        ("--dataloader_type=bogus",),
+        ("--mock_gpu=true",),
+    ],
+)
+def test_scan_args_falls_back_to_argparse(args):
+    assert config._scan_args(args) is None
+
+
+@pytest.mark.parametrize(
+    "args, expected_cls, field, expected_value",
+    [
+        (
+            ["--dataloader_type=torch", "--num_torch_workers", "16"],
+            TorchConfig,
+            "num_torch_workers",
+            16,
+        ),
+        # Falls back to argparse (negative value passed as separate arg)
+        (
+            ["--local_buffer_shuffle_size", "-5"],
+            RayDataConfig,
+            "local_buffer_shuffle_size",
+            -5,
+        ),
+    ],
+)
+def test_cli_to_config(monkeypatch, args, expected_cls, field, expected_value):
+    monkeypatch.setattr(sys, "argv", ["train_benchmark.py", *args])
+
+    dataloader_config = cli_to_config().dataloader_config
+
+    assert type(dataloader_config) is expected_cls
+    value = getattr(dataloader_config, field)
+    assert value == expected_value
+    assert type(value) is type(expected_value)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))